@@ -1398,7 +1398,9 @@ def main():
         print(f"❌ Audit report not found: {args.input}")
         sys.exit(1)
 
-    report = json.loads(report_path.read_text())
+    # read_bytes: json.loads accepts UTF-8 bytes directly, skipping the
+    # intermediate str the multi-MB report would otherwise round-trip through
+    report = json.loads(report_path.read_bytes())
     html = generate_dashboard(report)
 
     output_path = Path(args.output)
@@ -9,18 +9,82 @@ CSIAC Domains:
   - SoftSec: Input validation, no debug mode in production
 """
 
+import atexit
 import base64
+import datetime
+import functools
+import gzip
+import itertools
+import hashlib
 import json
+import logging
+import operator
 import os
 import re
+import signal
 import subprocess
 import sys
+import tempfile
 import threading
 import time
+import types
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeout
 from pathlib import Path
 
 import requests as http_requests
-from flask import Flask, send_from_directory, jsonify, request, g
+from requests.adapters import HTTPAdapter, Retry
+from flask import Flask, Response, jsonify, request, g
+from werkzeug.wsgi import wrap_file
+
+# Optional: brotli gives ~20% better compression than gzip for the
+# precompressed artifact variants; fall back to gzip-only without it.
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# Optional: orjson parses the (potentially multi-MB) audit report 2-5x
+# faster than stdlib json and accepts raw bytes, skipping the UTF-8
+# decode pass entirely. Falls back to stdlib when unavailable.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _json_loads(data):
+    """Parse JSON bytes with orjson when available, stdlib otherwise."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps_bytes(obj) -> bytes:
+    """Serialize to JSON bytes with orjson when available, stdlib otherwise.
+
+    default=str mirrors the auditor's own handling of datetimes and other
+    non-JSON-native values.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, default=str)
+    return json.dumps(obj, default=str).encode("utf-8")
+
+
+# Pre-serialized error payloads for the request-path rejections. The set
+# of error messages is fixed and small, so each body is built once at
+# import time instead of dict + jsonify + serialization on every error
+# return. Pipeline failures are not listed here: since the refresh moved
+# to a background job, those surface via the job future / /api/status.
+_ERR = {
+    "no_token": (_json_dumps_bytes({"error": "No GitHub token configured on server"}), 401),
+    "bad_owner": (_json_dumps_bytes({"error": "Invalid owner parameter"}), 400),
+}
+
+
+def _error_response(key: str) -> Response:
+    """Return a canned JSON error response with zero per-call allocation."""
+    body, status = _ERR[key]
+    return Response(body, status=status, mimetype="application/json")
 
 # ---------------------------------------------------------------------------
 # Security Logger Setup (CSIAC Forensics)
@@ -32,6 +96,7 @@ try:
     from security_logger import (
         setup_security_logger,
         log_security_event,
+        flush_logger,
         generate_request_id,
         get_client_ip,
         log_request_start,
@@ -39,18 +104,34 @@ try:
     )
     logger = setup_security_logger("chad-dashboard", service="chad-dashboard")
 except ImportError:
-    import logging
+    from logging.handlers import MemoryHandler
+
     logger = logging.getLogger("chad-dashboard")
     logger.setLevel(logging.INFO)
-    handler = logging.StreamHandler(sys.stdout)
-    logger.addHandler(handler)
-
-    def log_security_event(lg, event_type, message, level=logging.INFO, **ctx):
+    # Same buffering as setup_security_logger: one write() burst per
+    # request instead of one per record
+    logger.addHandler(MemoryHandler(
+        capacity=64, flushLevel=logging.WARNING,
+        target=logging.StreamHandler(sys.stdout),
+    ))
+
+    def flush_logger(lg):
+        for h in lg.handlers:
+            h.flush()
+
+    def log_security_event(lg, event_type, message, *args, level=logging.INFO, **ctx):
+        if args:
+            message = message % args
         lg.log(level, f"[{event_type}] {message} {ctx}")
 
+    _request_id_pid = os.getpid()
+    _request_id_counter = itertools.count()
+
     def generate_request_id():
-        import uuid
-        return str(uuid.uuid4())
+        # pid + monotonic ns + counter: unique per instance, no urandom
+        # syscall per request (correlation IDs need uniqueness, not
+        # unpredictability)
+        return f"{_request_id_pid:x}-{time.monotonic_ns():x}-{next(_request_id_counter):x}"
 
     def get_client_ip(req):
         fwd = req.headers.get("X-Forwarded-For", "")
@@ -62,19 +143,342 @@ except ImportError:
     def log_request_end(lg, req, resp, rid, dur):
         pass
 
+# Try to import the pipeline stages for in-process execution. In the
+# container image the generator scripts sit next to this file (see
+# Dockerfile.dashboard); in a bare checkout they live under
+# .github/scripts and the subprocess fallback below is used instead.
+try:
+    import repo_auditor
+    import dashboard_generator
+    import ops_page_generator
+    _INPROCESS_PIPELINE = True
+except ImportError:
+    repo_auditor = dashboard_generator = ops_page_generator = None
+    _INPROCESS_PIPELINE = False
+
 # ---------------------------------------------------------------------------
 # App Initialization
 # ---------------------------------------------------------------------------
 
 app = Flask(__name__, static_folder="static")
 
+# Route jsonify() through orjson when available: the deployments and
+# status payloads are re-serialized on every poll, and orjson is several
+# times faster than Flask's stdlib-based provider.
+if orjson is not None:
+    from flask.json.provider import JSONProvider
+
+    class _OrjsonProvider(JSONProvider):
+        def dumps(self, obj, **kwargs):
+            # default=str mirrors the auditor's own serialization of
+            # datetimes and other non-JSON-native values
+            return orjson.dumps(obj, default=str).decode("utf-8")
+
+        def loads(self, s, **kwargs):
+            return orjson.loads(s)
+
+    app.json = _OrjsonProvider(app)
+
 STATIC_DIR = Path(__file__).parent / "static"
 
-# CSIAC IAM: Input validation regex for GitHub usernames
-_VALID_OWNER_RE = re.compile(r"^[a-zA-Z0-9]([a-zA-Z0-9_-]{0,37}[a-zA-Z0-9])?$")
+# Hot-path artifact locations, composed once at import. These are rebuilt
+# on nearly every request (status polling, page loads, refresh cycles);
+# precomputing skips the repeated Path arithmetic and str() conversions.
+_AUDIT_REPORT_PATH = STATIC_DIR / "audit_report.json"
+_AUDIT_REPORT_TMP_PATH = STATIC_DIR / "audit_report.json.tmp"
+_DASHBOARD_HTML_PATH = STATIC_DIR / "dashboard.html"
+_OPS_HTML_PATH = STATIC_DIR / "ops.html"
+_MERMAID_PATH = Path(__file__).parent / "docs" / "architecture.mermaid"
+_ARCH_MD_PATH = Path(__file__).parent / "docs" / "architecture.md"
+_DASHBOARD_HTML_STR = str(_DASHBOARD_HTML_PATH)
+_OPS_HTML_STR = str(_OPS_HTML_PATH)
+
+# Zero-copy static serving: WhiteNoise serves files from STATIC_DIR at the
+# WSGI layer via the server's file wrapper (sendfile on gunicorn), with
+# ETag/Last-Modified handling, instead of Flask's Python read/write loop.
+# autorefresh=True because audit_report.json / dashboard.html are generated
+# at runtime, after the process has started. Optional: the Flask routes
+# below remain as a fallback when whitenoise is not installed.
+try:
+    from whitenoise import WhiteNoise
+
+    class _ArtifactWhiteNoise(WhiteNoise):
+        """WhiteNoise that refuses to serve runtime scratch files.
+
+        The atomic-write helpers stage *.tmp siblings inside STATIC_DIR
+        (os.replace demands same-filesystem paths), and the audit
+        subprocess writes audit_report.json.tmp there for the whole
+        120-180s audit. Serving those would expose half-written JSON.
+        """
+
+        def find_file(self, url):
+            if url.endswith(".tmp"):
+                return None
+            return super().find_file(url)
+
+    app.wsgi_app = _ArtifactWhiteNoise(
+        app.wsgi_app, root=str(STATIC_DIR), prefix="/", max_age=30,
+        autorefresh=True,
+    )
+except ImportError:
+    pass
+
+# CSIAC IAM: Input validation regex for GitHub usernames.
+# ASCII mode + fullmatch keeps the regex engine on its fast path; callers
+# length-gate before matching so pathological inputs never reach the engine.
+_VALID_OWNER_RE = re.compile(r"[a-zA-Z0-9](?:[a-zA-Z0-9_-]{0,37}[a-zA-Z0-9])?", re.ASCII)
+_MAX_OWNER_LEN = 39  # GitHub username limit
+_VALID_REPO_RE = re.compile(r"[a-zA-Z0-9._-]{1,100}", re.ASCII)
+_MAX_REPO_LEN = 100
+
+
+def _is_valid_owner(s) -> bool:
+    """Length-gate first so pathological inputs never reach the regex."""
+    return isinstance(s, str) and 1 <= len(s) <= _MAX_OWNER_LEN \
+        and _VALID_OWNER_RE.fullmatch(s) is not None
+
+
+def _is_valid_repo(s) -> bool:
+    return isinstance(s, str) and 1 <= len(s) <= _MAX_REPO_LEN \
+        and _VALID_REPO_RE.fullmatch(s) is not None
 
 # Extra orgs to scan (comma-separated)
 EXTRA_ORGS = os.environ.get("EXTRA_ORGS", "bluefalconink")
+_EXTRA_ORGS_LIST = [o.strip() for o in EXTRA_ORGS.split(",") if o.strip()]
+
+# Single worker for in-process pipeline stages: stages run one at a time
+# (every pipeline runs under _refresh_lock in _do_refresh) and the future's
+# result(timeout=...) preserves the per-stage timeout the subprocess
+# calls used to provide. Note a timed-out stage keeps running in the
+# worker until it finishes — it just stops blocking the caller.
+_stage_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="refresh-stage")
+
+
+def _run_stage(fn, timeout, *args, **kwargs):
+    """Run one pipeline stage with a hard wall-clock timeout.
+
+    Raises concurrent.futures.TimeoutError (FuturesTimeout) on overrun,
+    mirroring subprocess.TimeoutExpired in the fallback path.
+    """
+    return _stage_executor.submit(fn, *args, **kwargs).result(timeout=timeout)
+
+
+# Background refresh job state: /api/refresh submits the pipeline here and
+# returns 202 immediately instead of pinning a request worker for minutes.
+# One worker — refreshes are serial by design. _refresh_submit_lock guards
+# only the submit-or-reject decision (held for microseconds), unlike
+# _refresh_lock below which _do_refresh holds for a whole pipeline.
+_refresh_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="refresh-job")
+_refresh_submit_lock = threading.Lock()
+_current_refresh = None
+
+
+@functools.lru_cache(maxsize=2)
+def _subprocess_env(token: str) -> dict:
+    """Build a minimal environment for the audit subprocesses.
+
+    Copying os.environ hands the child every Cloud Run env var (100+);
+    the auditor only needs PATH, HOME, and the GitHub token. Keeping the
+    dict small avoids the copy and limits env leakage into children.
+    The token rarely changes within a process, so the dict is cached per
+    token rather than rebuilt for every refresh; callers must not mutate
+    the returned dict.
+    """
+    return {
+        "PATH": os.environ.get("PATH", ""),
+        "PYTHONPATH": os.environ.get("PYTHONPATH", ""),
+        "HOME": os.environ.get("HOME", "/tmp"),
+        "GITHUB_TOKEN": token,
+        "GH_TOKEN": token,
+    }
+
+
+# Subprocess stderr lands in an on-disk log; only this much is read back
+# for the failure log line. The full log survives for post-mortems. It
+# lives under the system temp dir, NOT STATIC_DIR: WhiteNoise serves the
+# static root wholesale, and raw auditor stderr (tracebacks, internal
+# URLs) must stay server-side (CSIAC Forensics).
+_SUBPROC_LOG_PATH = Path(tempfile.gettempdir()) / "chad_audit.log"
+_STDERR_TAIL_BYTES = 32 * 1024
+
+
+def _run_bounded(cmd, timeout, env=None, cwd=None):
+    """Run *cmd* with stderr redirected straight to the audit log file.
+
+    capture_output=True holds the child's entire stdout/stderr in memory for
+    the life of the process, even though only the first few hundred bytes are
+    ever logged. Handing the child a real file descriptor instead means the
+    kernel absorbs the writes directly -- no pipe to fill up, no reader
+    thread to drain it -- and a bounded tail is seeked out afterwards.
+
+    Only one subprocess runs at a time (the refresh executor is
+    single-worker), so a single log file is safe; each run truncates it.
+
+    Returns (returncode, stderr_tail). Raises subprocess.TimeoutExpired on
+    timeout, matching subprocess.run semantics.
+    """
+    # stdin=DEVNULL + close_fds with an empty pass_fds (and no preexec_fn)
+    # keeps CPython on its fastest child-spawn path, avoiding a walk over
+    # every inherited descriptor under high fd limits.
+    with open(_SUBPROC_LOG_PATH, "wb") as log_file:
+        proc = subprocess.Popen(
+            cmd, stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL, stderr=log_file,
+            env=env, cwd=cwd,
+            close_fds=True, pass_fds=(),
+        )
+        try:
+            returncode = proc.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()
+            raise
+    return returncode, _read_subproc_log_tail()
+
+
+def _read_subproc_log_tail():
+    """Return the last _STDERR_TAIL_BYTES of the subprocess log as text."""
+    try:
+        with open(_SUBPROC_LOG_PATH, "rb") as fh:
+            fh.seek(0, os.SEEK_END)
+            size = fh.tell()
+            fh.seek(max(0, size - _STDERR_TAIL_BYTES))
+            return fh.read().decode("utf-8", errors="replace")
+    except OSError:
+        return ""
+
+
+# Generated artifacts worth precompressing (all highly compressible text)
+_COMPRESSIBLE_ARTIFACTS = ("audit_report.json", "dashboard.html", "ops.html")
+
+
+def _precompress_artifacts():
+    """Write .gz (and .br, when brotli is installed) variants of the
+    generated artifacts.
+
+    Compressing once at generation time lets WhiteNoise serve the
+    precompressed bytes to clients advertising Accept-Encoding — a 5-10x
+    bandwidth cut on the JSON/HTML payloads with zero per-request CPU.
+    """
+    for name in _COMPRESSIBLE_ARTIFACTS:
+        path = STATIC_DIR / name
+        if not path.exists():
+            continue
+        try:
+            data = path.read_bytes()
+            _atomic_write(STATIC_DIR / (name + ".gz"),
+                          gzip.compress(data, compresslevel=6))
+            if brotli is not None:
+                _atomic_write(STATIC_DIR / (name + ".br"),
+                              brotli.compress(data, quality=5))
+        except OSError:
+            logger.warning("Precompression failed for %s (non-fatal)", name)
+
+
+def _atomic_write(path: Path, data: bytes):
+    """Write *data* to *path* via a temp file + os.replace().
+
+    os.replace() is POSIX-atomic, so concurrent readers (static serving,
+    status polls) always see either the old file or the new one — never a
+    truncated half-write.
+    """
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+
+# Parsed-report cache keyed on the file's mtime. The report only changes
+# at refresh time, but /api/status, /api/deployments and the dashboard
+# routes are polled constantly — without this every poll re-parses a
+# potentially multi-MB JSON file.
+_report_cache = {"mtime_ns": -1, "data": None}
+_report_cache_lock = threading.Lock()
+
+
+def _load_report_cached():
+    """Return the parsed audit report, re-parsing only on mtime change.
+
+    Returns None when the report is missing or unparseable. The atomic
+    rename in the refresh path bumps the mtime, which invalidates the
+    cache on the next read — no explicit invalidation hook needed.
+    """
+    report_path = _AUDIT_REPORT_PATH
+    try:
+        mtime_ns = report_path.stat().st_mtime_ns
+    except OSError:
+        return None
+    with _report_cache_lock:
+        if _report_cache["mtime_ns"] != mtime_ns:
+            try:
+                report = _json_loads(report_path.read_bytes())
+                # Inside the try: a wrong-shape report (top-level array,
+                # repo record without "name") must degrade to None like
+                # any other parse failure, not 500 every route that reads
+                # the cache.
+                _postprocess_report(report)
+            except Exception:
+                return None
+            _report_cache["data"] = report
+            _report_cache["mtime_ns"] = mtime_ns
+        return _report_cache["data"]
+
+
+def _postprocess_report(report: dict) -> None:
+    """Stamp server-side derived fields onto a freshly parsed report.
+
+    Derives owner/name once per parse: the deployments and recommendations
+    endpoints interpolate this for every repo on every call otherwise. The
+    underscore key marks it as derived, not part of the auditor's schema.
+    """
+    default_owner = report.get("owner", "koreric75")
+    for r in report.get("repos", []):
+        r["_full_name"] = f"{r.get('owner', default_owner)}/{r['name']}"
+
+
+# Content-derived ETag for audit_report.json, keyed on mtime so the hash
+# is computed once per refresh, not once per poll. Content hashing beats
+# the mtime-only tag for this file: a refresh that produces byte-identical
+# output (common when nothing changed upstream) still collapses to a 304.
+_report_etag_cache = {"mtime_ns": -1, "etag": ""}
+
+
+def _report_etag(mtime_ns: int) -> str:
+    """Return the cached content ETag for the report, rehashing on change."""
+    with _report_cache_lock:
+        if _report_etag_cache["mtime_ns"] != mtime_ns:
+            try:
+                digest = hashlib.blake2b(
+                    _AUDIT_REPORT_PATH.read_bytes(), digest_size=8,
+                ).hexdigest()
+            except OSError:
+                return f"{mtime_ns:x}"
+            _report_etag_cache["etag"] = digest
+            _report_etag_cache["mtime_ns"] = mtime_ns
+        return _report_etag_cache["etag"]
+
+
+def _prime_report_cache(report: dict, report_path: Path, data: bytes = None) -> None:
+    """Seed the parse cache with a report dict the server already holds.
+
+    The in-process refresh builds the report in memory; caching it here
+    means the next status/deployments poll skips re-parsing the file it
+    just wrote. When the serialized bytes are supplied, the content ETag
+    is seeded too, saving the re-read in _report_etag.
+    """
+    try:
+        mtime_ns = report_path.stat().st_mtime_ns
+    except OSError:
+        return
+    _postprocess_report(report)
+    if data is not None:
+        with _report_cache_lock:
+            _report_etag_cache["etag"] = hashlib.blake2b(
+                data, digest_size=8,
+            ).hexdigest()
+            _report_etag_cache["mtime_ns"] = mtime_ns
+    with _report_cache_lock:
+        _report_cache["data"] = report
+        _report_cache["mtime_ns"] = mtime_ns
 
 
 # ---------------------------------------------------------------------------
@@ -85,14 +489,18 @@ EXTRA_ORGS = os.environ.get("EXTRA_ORGS", "bluefalconink")
 def before_request_hook():
     """Log incoming requests and set correlation ID."""
     g.request_id = generate_request_id()
-    g.start_time = time.time()
+    # Parse X-Forwarded-For once; several handlers and log sites want it
+    g.client_ip = get_client_ip(request)
+    # Monotonic integer clock: one call, no float math, immune to wall
+    # clock jumps (NTP slews on Cloud Run would skew time.time() pairs)
+    g.start_ns = time.monotonic_ns()
     # Log at DEBUG for health checks to reduce noise
     if request.path == "/health":
         logger.debug(
-            f"{request.method} {request.path}",
+            "%s %s", request.method, request.path,
             extra={
                 "event_type": "request_start",
-                "source_ip": get_client_ip(request),
+                "source_ip": g.client_ip,
                 "request_id": g.request_id,
             },
         )
@@ -100,12 +508,46 @@ def before_request_hook():
         log_request_start(logger, request, g.request_id)
 
 
+# Paths whose responses are backed by a generated static file — these get
+# mtime-derived ETags so repeat dashboard viewers collapse to 0-byte 304s
+_CONDITIONAL_PATHS = {
+    "/": "dashboard.html",
+    "/audit_report.json": "audit_report.json",
+    "/ops": "ops.html",
+}
+
+
 @app.after_request
 def after_request_hook(response):
-    """Log response status and duration."""
-    duration_ms = (time.time() - g.get("start_time", time.time())) * 1000
+    """Log response status and duration; add conditional-request headers."""
+    backing_file = _CONDITIONAL_PATHS.get(request.path)
+    if backing_file is not None and response.status_code == 200:
+        try:
+            mtime_ns = (STATIC_DIR / backing_file).stat().st_mtime_ns
+        except OSError:
+            mtime_ns = None
+        if mtime_ns is not None:
+            if backing_file == "audit_report.json":
+                etag = _report_etag(mtime_ns)
+            else:
+                etag = f"{mtime_ns:x}"
+            # Encoded variants must not share a tag with the identity
+            # response, or caches could serve compressed bytes to clients
+            # that never asked for them
+            content_encoding = response.headers.get("Content-Encoding")
+            if content_encoding:
+                etag = f"{etag}-{content_encoding}"
+            response.set_etag(etag)
+            response.headers["Cache-Control"] = "public, max-age=60"
+            # Turns the response into a 304 when If-None-Match matches
+            response = response.make_conditional(request)
+
     if request.path != "/health":
+        start_ns = g.get("start_ns")
+        duration_ms = (time.monotonic_ns() - start_ns) // 1_000_000 if start_ns else 0
         log_request_end(logger, request, response, g.get("request_id", ""), duration_ms)
+        # One buffered-log flush per request (see MemoryHandler setup)
+        flush_logger(logger)
     return response
 
 
@@ -113,6 +555,47 @@ def after_request_hook(response):
 # Routes
 # ---------------------------------------------------------------------------
 
+def _send_file_sendfile(path, mimetype: str):
+    """Serve a generated static file through the WSGI server's file wrapper.
+
+    wrap_file + direct_passthrough lets gunicorn use sendfile(2), so the
+    (potentially hundreds-of-KB) dashboard HTML never passes through a
+    Python read/write loop. When the client accepts it, the precompressed
+    .br/.gz sibling written by _precompress_artifacts is served instead
+    with Content-Encoding — ~10x fewer bytes for the JSON report — as
+    long as the variant is at least as fresh as the source. The
+    after_request hook still attaches the ETag and downgrades to 304.
+    """
+    fh = None
+    encoding = None
+    accepted = request.accept_encodings
+    for enc, suffix in (("br", ".br"), ("gzip", ".gz")):
+        if enc not in accepted:
+            continue
+        variant = Path(f"{path}{suffix}")
+        try:
+            if variant.stat().st_mtime_ns >= path.stat().st_mtime_ns:
+                fh = open(variant, "rb")
+                encoding = enc
+                break
+        except OSError:
+            continue
+    if fh is None:
+        try:
+            fh = open(path, "rb")
+        except OSError:
+            return Response("Not found", status=404, mimetype="text/plain")
+    resp = Response(
+        wrap_file(request.environ, fh), mimetype=mimetype,
+        direct_passthrough=True,
+    )
+    resp.headers["Content-Length"] = os.fstat(fh.fileno()).st_size
+    resp.headers["Vary"] = "Accept-Encoding"
+    if encoding is not None:
+        resp.headers["Content-Encoding"] = encoding
+    return resp
+
+
 _LOADING_PAGE = """<!DOCTYPE html>
 <html lang="en">
 <head>
@@ -160,7 +643,8 @@ _LOADING_PAGE = """<!DOCTYPE html>
       try {
         const r = await fetch("/api/refresh", {method:"POST",
                     headers:{"Content-Type":"application/json"},body:"{}"});
-        if (!r.ok) setMsg("Refresh returned " + r.status + " — retrying…","err");
+        // 409 = a refresh is already running, which is fine — just poll
+        if (!r.ok && r.status !== 409) setMsg("Refresh returned " + r.status + " — retrying…","err");
       } catch(e) { setMsg("Network error triggering refresh — will retry","err"); }
     }
 
@@ -211,7 +695,7 @@ _LOADING_PAGE = """<!DOCTYPE html>
 def index():
     """Serve the CHAD dashboard, or a self-healing loading page on cold-start."""
     if _dashboard_has_data():
-        return send_from_directory(STATIC_DIR, "dashboard.html")
+        return _send_file_sendfile(_DASHBOARD_HTML_PATH, "text/html; charset=utf-8")
     # Serve smart loading page that triggers & polls refresh automatically
     return _LOADING_PAGE.replace("%%PAGE%%", "dashboard"), 200
 
@@ -219,7 +703,7 @@ def index():
 @app.route("/audit_report.json")
 def audit_report():
     """Serve the latest audit report."""
-    return send_from_directory(STATIC_DIR, "audit_report.json")
+    return _send_file_sendfile(_AUDIT_REPORT_PATH, "application/json")
 
 
 @app.route("/api/refresh", methods=["POST"])
@@ -229,16 +713,21 @@ def refresh():
     CSIAC IAM: Token is sourced ONLY from server-side environment variables.
     Client-submitted tokens are rejected to prevent token-over-wire exposure.
     """
+    # CSIAC Forensics: Resolve the request context once — the happy and
+    # error paths below would otherwise re-derive these half a dozen times.
+    rid = g.get("request_id", "")
+    ip = g.get("client_ip", "unknown")
+    ctx = {"source_ip": ip, "request_id": rid}
+
     # CSIAC IAM: Use only server-side token — never accept from request body
     token = (os.environ.get("GITHUB_TOKEN") or os.environ.get("GH_TOKEN") or "").strip() or None
 
     if not token:
         log_security_event(
             logger, "auth_failure", "No server-side GitHub token configured",
-            source_ip=get_client_ip(request),
-            request_id=g.get("request_id", ""),
+            **ctx,
         )
-        return jsonify({"error": "No GitHub token configured on server"}), 401
+        return _error_response("no_token")
 
     body = request.get_json(silent=True) or {}
 
@@ -247,134 +736,226 @@ def refresh():
         log_security_event(
             logger, "policy_violation",
             "Client attempted to submit token in request body — ignored",
-            source_ip=get_client_ip(request),
-            request_id=g.get("request_id", ""),
-            level=__import__("logging").WARNING,
+            level=logging.WARNING,
+            **ctx,
         )
 
     # CSIAC SoftSec: Validate owner parameter
     owner = body.get("owner", os.environ.get("GITHUB_OWNER", "koreric75"))
-    if not _VALID_OWNER_RE.match(owner):
+    if not _is_valid_owner(owner):
         log_security_event(
             logger, "input_validation_failure",
-            f"Invalid owner parameter rejected: {owner[:50]}",
-            source_ip=get_client_ip(request),
-            request_id=g.get("request_id", ""),
-            level=__import__("logging").WARNING,
+            "Invalid owner parameter rejected: %.50s", owner,
+            level=logging.WARNING,
+            **ctx,
         )
-        return jsonify({"error": "Invalid owner parameter"}), 400
+        return _error_response("bad_owner")
 
     log_security_event(
         logger, "audit_trigger",
-        f"Audit refresh triggered for owner={owner} extra_orgs={EXTRA_ORGS}",
-        source_ip=get_client_ip(request),
-        request_id=g.get("request_id", ""),
+        "Audit refresh triggered for owner=%s extra_orgs=%s", owner, EXTRA_ORGS,
+        **ctx,
     )
 
+    # Submit as a background job: the pipeline can take minutes and used
+    # to pin a request worker (and the client's connection) for its whole
+    # duration. 202 + /api/status polling conveys the same information
+    # without holding anything open.
+    global _current_refresh
+    with _refresh_submit_lock:
+        # _refresh_in_progress covers the periodic auto-refresh cycle,
+        # which never goes through _current_refresh: rejecting here beats
+        # accepting a job that would sit behind a multi-minute audit.
+        if _refresh_in_progress or (
+                _current_refresh is not None and not _current_refresh.done()):
+            return jsonify({"status": "already_running", "job_id": rid}), 409
+        _current_refresh = _refresh_executor.submit(_do_refresh, owner, token, rid)
+
+    return jsonify({"status": "accepted", "job_id": rid}), 202
+
+
+class _RefreshStageFailed(RuntimeError):
+    """A refresh pipeline stage failed; already logged at the failure site."""
+
+
+def _do_refresh(owner: str, token: str, rid: str,
+                audit_timeout: int = 120, gen_timeout: int = 30) -> dict:
+    """Execute the full refresh pipeline: audit → dashboard → ops page.
+
+    Runs on the background refresh worker, not a request thread. Returns
+    the completed audit's summary numbers; raises on failure so the job
+    future surfaces job_state == "failed" via /api/status.
+    """
     global _refresh_in_progress, _last_refresh_time
+    # Serialize with the periodic auto-refresh cycle: concurrent pipelines
+    # would interleave through the single-worker _stage_executor, so one
+    # job's stage timeout would silently include the other's queue time
+    # (and in the fallback path both would truncate the shared stderr log).
+    _refresh_lock.acquire()
     _refresh_in_progress = True
     try:
-        # Set token for subprocess
-        env = os.environ.copy()
-        env["GITHUB_TOKEN"] = token
-        env["GH_TOKEN"] = token
-
-        # Build auditor command with extra orgs support
-        cmd = [
-            sys.executable, "repo_auditor.py",
-            "--owner", owner,
-            "--output", str(STATIC_DIR / "audit_report.json"),
-        ]
-        if EXTRA_ORGS:
-            cmd.extend(["--extra-orgs", EXTRA_ORGS])
-
-        # Run auditor
-        result = subprocess.run(
-            cmd,
-            capture_output=True, text=True, timeout=120, env=env,
-            cwd=Path(__file__).parent,
-        )
-        if result.returncode != 0:
-            # CSIAC Forensics: Log full error server-side, return generic message
-            logger.error(
-                f"Audit subprocess failed: {result.stderr[:500]}",
-                extra={
-                    "event_type": "audit_failure",
-                    "request_id": g.get("request_id", ""),
-                },
-            )
-            return jsonify({"error": "Audit process failed"}), 500
-
-        # Regenerate dashboard
-        result2 = subprocess.run(
-            [sys.executable, "dashboard_generator.py",
-             "--input", str(STATIC_DIR / "audit_report.json"),
-             "--output", str(STATIC_DIR / "dashboard.html")],
-            capture_output=True, text=True, timeout=30,
-            cwd=Path(__file__).parent,
-        )
-        if result2.returncode != 0:
-            logger.error(
-                f"Dashboard generation failed: {result2.stderr[:500]}",
-                extra={
-                    "event_type": "dashboard_generation_failure",
-                    "request_id": g.get("request_id", ""),
-                },
-            )
-            return jsonify({"error": "Dashboard generation failed"}), 500
-
-        # Generate Ops Center page
+        report_path = _AUDIT_REPORT_PATH
         app_dir = Path(__file__).parent
-        mermaid_path = app_dir / "docs" / "architecture.mermaid"
-        ops_cmd = [
-            sys.executable, "ops_page_generator.py",
-            "--input", str(STATIC_DIR / "audit_report.json"),
-            "--mermaid", str(mermaid_path),
-            "--output", str(STATIC_DIR / "ops.html"),
-        ]
-        result3 = subprocess.run(
-            ops_cmd, capture_output=True, text=True, timeout=30,
-            cwd=app_dir,
-        )
-        if result3.returncode != 0:
-            logger.warning(f"Ops page generation failed (non-fatal): {result3.stderr[:300]}")
+        mermaid_path = _MERMAID_PATH
+
+        if _INPROCESS_PIPELINE:
+            # Run the pipeline stages in-process: no fork/exec, no
+            # interpreter warmup per stage, and the report dict flows
+            # between stages in memory instead of via disk + re-parse.
+            try:
+                report = _run_stage(
+                    repo_auditor.run_audit, audit_timeout, owner, token,
+                    extra_orgs=_EXTRA_ORGS_LIST,
+                )
+            except FuturesTimeout:
+                raise
+            except Exception:
+                logger.exception(
+                    "In-process audit failed",
+                    extra={"event_type": "audit_failure", "request_id": rid},
+                )
+                raise _RefreshStageFailed("audit stage failed")
+
+            # Persist the report atomically so concurrent readers never
+            # parse a half-written file. Compact orjson-backed output: the
+            # report is the largest artifact and indentation only added
+            # bytes for a file consumed by machines.
+            data = _json_dumps_bytes(report)
+            _atomic_write(report_path, data)
+            _prime_report_cache(report, report_path, data)
+
+            try:
+                html = _run_stage(dashboard_generator.generate_dashboard, gen_timeout, report)
+                _atomic_write(_DASHBOARD_HTML_PATH, html.encode("utf-8"))
+            except FuturesTimeout:
+                raise
+            except Exception:
+                logger.exception(
+                    "In-process dashboard generation failed",
+                    extra={"event_type": "dashboard_generation_failure",
+                           "request_id": rid},
+                )
+                raise _RefreshStageFailed("dashboard stage failed")
 
-        # Load summary
-        report = json.loads((STATIC_DIR / "audit_report.json").read_text())
+            try:
+                mermaid_src = (
+                    mermaid_path.read_text(encoding="utf-8")
+                    if mermaid_path.exists() else ""
+                )
+                ops_html = _run_stage(
+                    ops_page_generator.generate_ops_page, gen_timeout, report, mermaid_src,
+                )
+                _atomic_write(_OPS_HTML_PATH, ops_html.encode("utf-8"))
+            except Exception:
+                logger.warning("Ops page generation failed (non-fatal)", exc_info=True)
+        else:
+            # Subprocess fallback for environments where the pipeline
+            # modules are not importable (bare checkout).
+            env = _subprocess_env(token)
+
+            # Build auditor command with extra orgs support. The auditor
+            # writes to a temp file; we swap it in atomically on success so
+            # concurrent readers never parse a half-written report.
+            report_tmp = _AUDIT_REPORT_TMP_PATH
+            cmd = [
+                sys.executable, "repo_auditor.py",
+                "--owner", owner,
+                "--output", str(report_tmp),
+            ]
+            if EXTRA_ORGS:
+                cmd.extend(["--extra-orgs", EXTRA_ORGS])
+
+            # Run auditor
+            rc, stderr_tail = _run_bounded(
+                cmd, timeout=audit_timeout, env=env, cwd=app_dir,
+            )
+            if rc != 0:
+                # CSIAC Forensics: Log full error server-side, return generic message
+                logger.error(
+                    "Audit subprocess failed: %.500s", stderr_tail,
+                    extra={
+                        "event_type": "audit_failure",
+                        "request_id": rid,
+                    },
+                )
+                raise _RefreshStageFailed("audit stage failed")
+
+            # POSIX-atomic swap: readers see old or new report, never a torn one
+            os.replace(report_tmp, report_path)
+
+            # Regenerate dashboard
+            rc2, stderr_tail2 = _run_bounded(
+                [sys.executable, "dashboard_generator.py",
+                 "--input", str(report_path),
+                 "--output", _DASHBOARD_HTML_STR],
+                timeout=gen_timeout,
+                cwd=app_dir,
+            )
+            if rc2 != 0:
+                logger.error(
+                    "Dashboard generation failed: %.500s", stderr_tail2,
+                    extra={
+                        "event_type": "dashboard_generation_failure",
+                        "request_id": rid,
+                    },
+                )
+                raise _RefreshStageFailed("dashboard stage failed")
+
+            # Generate Ops Center page
+            ops_cmd = [
+                sys.executable, "ops_page_generator.py",
+                "--input", str(report_path),
+                "--mermaid", str(mermaid_path),
+                "--output", _OPS_HTML_STR,
+            ]
+            rc3, stderr_tail3 = _run_bounded(ops_cmd, timeout=gen_timeout, cwd=app_dir)
+            if rc3 != 0:
+                logger.warning("Ops page generation failed (non-fatal): %.300s", stderr_tail3)
+
+            # Load summary through the shared mtime-keyed cache: this both
+            # avoids a duplicate parse here and leaves the cache warm for
+            # the status/deployments polls that follow a refresh
+            report = _load_report_cached() or {}
+
+        # Precompress the fresh artifacts for Accept-Encoding clients
+        _precompress_artifacts()
 
         log_security_event(
             logger, "audit_success",
-            f"Audit completed: {report.get('summary', {}).get('total_repos', 0)} repos",
-            request_id=g.get("request_id", ""),
+            "Audit completed: %s repos", report.get("summary", {}).get("total_repos", 0),
+            request_id=rid,
         )
 
         _last_refresh_time = time.time()
-        _refresh_in_progress = False
-        return jsonify({
-            "status": "ok",
+        return {
             "total_repos": report.get("summary", {}).get("total_repos", 0),
             "api_calls": report.get("api_calls_used", 0),
-        })
-    except subprocess.TimeoutExpired:
-        _refresh_in_progress = False
+        }
+    except _RefreshStageFailed:
+        # Already logged at the failure site — just mark the job failed
+        raise
+    except (subprocess.TimeoutExpired, FuturesTimeout):
         log_security_event(
-            logger, "audit_timeout", "Audit subprocess timed out",
-            source_ip=get_client_ip(request),
-            request_id=g.get("request_id", ""),
-            level=__import__("logging").ERROR,
+            logger, "audit_timeout", "Audit stage timed out",
+            level=logging.ERROR,
+            request_id=rid,
         )
-        return jsonify({"error": "Audit timed out"}), 504
-    except Exception as e:
-        _refresh_in_progress = False
+        raise
+    except Exception:
         logger.exception(
-            "Unexpected error in /api/refresh",
+            "Unexpected error in refresh job",
             extra={
                 "event_type": "unexpected_error",
-                "request_id": g.get("request_id", ""),
+                "request_id": rid,
             },
         )
-        # CSIAC SoftSec: Return generic error — never expose raw exception
-        return jsonify({"error": "Internal server error"}), 500
+        raise
+    finally:
+        _refresh_in_progress = False
+        # Off-request job: flush buffered logs here so the INFO tail
+        # doesn't sit in the MemoryHandler until the next request
+        flush_logger(logger)
+        _refresh_lock.release()
 
 
 @app.route("/health")
@@ -386,31 +967,41 @@ def health():
 @app.route("/api/status", methods=["GET"])
 def api_status():
     """Return CHAD refresh status — useful for debugging staleness."""
-    import datetime
-    report_path = STATIC_DIR / "audit_report.json"
+    report_path = _AUDIT_REPORT_PATH
     report_age = None
     total_repos = 0
     if report_path.exists():
         stat = report_path.stat()
         report_age = time.time() - stat.st_mtime
-        try:
-            rpt = json.loads(report_path.read_text())
+        rpt = _load_report_cached()
+        if rpt is not None:
             total_repos = rpt.get("summary", {}).get("total_repos", 0)
-        except Exception:
-            pass
 
     last_dt = (
         datetime.datetime.fromtimestamp(_last_refresh_time, tz=datetime.timezone.utc).isoformat()
         if _last_refresh_time > 0 else None
     )
+
+    # State of the background refresh job submitted via /api/refresh
+    job = _current_refresh
+    if job is None:
+        job_state = "idle"
+    elif not job.done():
+        job_state = "running"
+    elif job.exception() is not None:
+        job_state = "failed"
+    else:
+        job_state = "completed"
+
     return jsonify({
+        "job_state": job_state,
         "last_refresh_utc": last_dt,
         "refresh_interval_hours": REFRESH_INTERVAL / 3600,
         "refresh_in_progress": _refresh_in_progress,
         "report_age_seconds": round(report_age) if report_age is not None else None,
         "total_repos": total_repos,
-        "dashboard_exists": (STATIC_DIR / "dashboard.html").exists(),
-        "ops_exists": (STATIC_DIR / "ops.html").exists(),
+        "dashboard_exists": _DASHBOARD_HTML_PATH.exists(),
+        "ops_exists": _OPS_HTML_PATH.exists(),
     })
 
 
@@ -422,9 +1013,9 @@ def api_status():
 def ops_page():
     """Serve the CHAD Ops Center page, or a self-healing loading page on cold-start."""
     if _dashboard_has_data():
-        ops_html = STATIC_DIR / "ops.html"
+        ops_html = _OPS_HTML_PATH
         if ops_html.exists():
-            return send_from_directory(STATIC_DIR, "ops.html")
+            return _send_file_sendfile(_OPS_HTML_PATH, "text/html; charset=utf-8")
     # Serve smart loading page that triggers & polls refresh automatically
     return _LOADING_PAGE.replace("%%PAGE%%", "ops"), 200
 
@@ -439,33 +1030,46 @@ def get_architecture():
     mermaid_src = ""
     arch_md = ""
 
-    # Try fetching live from GitHub first, fall back to local file
+    # Try fetching live from GitHub first, fall back to local file.
+    # The two content fetches are independent I/O — issue them together so
+    # the worst case is one 10s timeout, not two in sequence.
     if token:
         headers = _github_headers(token)
-        try:
-            url = f"https://api.github.com/repos/{owner}/{repo}/contents/docs/architecture.mermaid"
-            resp = http_requests.get(url, headers=headers, timeout=10)
-            if resp.status_code == 200:
-                import base64 as b64
-                mermaid_src = b64.b64decode(resp.json()["content"]).decode("utf-8")
-        except Exception:
-            pass
-        try:
-            url = f"https://api.github.com/repos/{owner}/{repo}/contents/docs/architecture.md"
-            resp = http_requests.get(url, headers=headers, timeout=10)
-            if resp.status_code == 200:
-                import base64 as b64
-                arch_md = b64.b64decode(resp.json()["content"]).decode("utf-8")
-        except Exception:
-            pass
+        contents_base = f"https://api.github.com/repos/{owner}/{repo}/contents/docs"
+        with ThreadPoolExecutor(max_workers=2) as ex:
+            f_mermaid = ex.submit(
+                _github_session.get, f"{contents_base}/architecture.mermaid",
+                headers=headers, timeout=10,
+            )
+            f_md = ex.submit(
+                _github_session.get, f"{contents_base}/architecture.md",
+                headers=headers, timeout=10,
+            )
+            # _json_loads works on the raw response bytes (no UTF-8 decode
+            # pass with orjson), and the contents payload is mostly one
+            # large base64 string, so that pass is the expensive part.
+            try:
+                resp = f_mermaid.result()
+                if resp.status_code == 200:
+                    payload = _json_loads(resp.content)
+                    mermaid_src = base64.b64decode(payload["content"]).decode("utf-8")
+            except Exception:
+                pass
+            try:
+                resp = f_md.result()
+                if resp.status_code == 200:
+                    payload = _json_loads(resp.content)
+                    arch_md = base64.b64decode(payload["content"]).decode("utf-8")
+            except Exception:
+                pass
 
     # Fall back to local files in the container
     if not mermaid_src:
-        local = Path(__file__).parent / "docs" / "architecture.mermaid"
+        local = _MERMAID_PATH
         if local.exists():
             mermaid_src = local.read_text(encoding="utf-8")
     if not arch_md:
-        local = Path(__file__).parent / "docs" / "architecture.md"
+        local = _ARCH_MD_PATH
         if local.exists():
             arch_md = local.read_text(encoding="utf-8")
 
@@ -475,6 +1079,10 @@ def get_architecture():
     })
 
 
+# Deployment sort order: failing first, then degraded, healthy, unknown
+_HEALTH_ORDER = {"FAILING": 0, "DEGRADED": 1, "HEALTHY": 2, "UNKNOWN": 3}
+
+
 @app.route("/api/deployments", methods=["GET"])
 def get_deployments():
     """Fetch recent workflow runs across all audited repos.
@@ -489,18 +1097,20 @@ def get_deployments():
     headers = _github_headers(token)
 
     # Load latest audit report for repo list
-    report_path = STATIC_DIR / "audit_report.json"
-    if not report_path.exists():
+    report = _load_report_cached()
+    if report is None:
         return jsonify({"error": "No audit report available. Run /api/refresh first."}), 404
 
-    report = json.loads(report_path.read_text())
     repos = report.get("repos", [])
 
-    deployments = []
+    # Single pass: build entries, count summary stats, and precompute the
+    # sort key per entry instead of re-iterating the list five more times.
+    keyed = []
+    healthy = degraded = failing = no_ci = 0
     for repo_data in repos:
         repo_name = repo_data["name"]
         repo_owner = repo_data.get("owner", report.get("owner", "koreric75"))
-        full_name = f"{repo_owner}/{repo_name}"
+        full_name = repo_data["_full_name"]
 
         # Use cached workflow data from audit
         wf_data = repo_data.get("workflows", {})
@@ -515,6 +1125,16 @@ def get_deployments():
         staleness = repo_data.get("staleness", {})
         days_since_push = staleness.get("days_since_push", "?")
 
+        has_ci = len(cached_runs) > 0 or has_workflow
+        if health == "HEALTHY":
+            healthy += 1
+        elif health == "DEGRADED":
+            degraded += 1
+        elif health == "FAILING":
+            failing += 1
+        if not has_ci:
+            no_ci += 1
+
         entry = {
             "repo": repo_name,
             "owner": repo_owner,
@@ -522,23 +1142,17 @@ def get_deployments():
             "url": url,
             "tier": tier,
             "is_archived": is_archived,
-            "has_ci": len(cached_runs) > 0 or has_workflow,
+            "has_ci": has_ci,
             "health": health,
             "days_since_push": days_since_push,
             "recent_runs": cached_runs[:5],
         }
-        deployments.append(entry)
+        keyed.append(((_HEALTH_ORDER.get(health, 9), full_name), entry))
 
     # Sort: failing first, then degraded, then healthy, then unknown
-    health_order = {"FAILING": 0, "DEGRADED": 1, "HEALTHY": 2, "UNKNOWN": 3}
-    deployments.sort(key=lambda d: (health_order.get(d["health"], 9), d["full_name"]))
-
-    # Summary stats
+    keyed.sort(key=operator.itemgetter(0))
+    deployments = [entry for _, entry in keyed]
     total = len(deployments)
-    healthy = sum(1 for d in deployments if d["health"] == "HEALTHY")
-    degraded = sum(1 for d in deployments if d["health"] == "DEGRADED")
-    failing = sum(1 for d in deployments if d["health"] == "FAILING")
-    no_ci = sum(1 for d in deployments if not d["has_ci"])
 
     # Build recommendations
     recommendations = _build_recommendations(deployments, repos, report)
@@ -560,66 +1174,86 @@ def _build_recommendations(deployments, repos, report):
     """Generate actionable recommendations based on deployment health + audit data."""
     recs = []
 
+    # Partition once: the previous five independent comprehensions each
+    # re-walked the same lists and re-chained the same nested .get() lookups.
+    # Two O(N) passes (one over deployment entries, one over raw repo
+    # records) collect every bucket with the dict traversal done once.
+    failing_repos = []
+    degraded_repos = []
+    no_ci_active = []
+    for d in deployments:
+        health = d["health"]
+        if health == "FAILING":
+            failing_repos.append(d["full_name"])
+        elif health == "DEGRADED":
+            degraded_repos.append(d["full_name"])
+        if not d["has_ci"] and not d["is_archived"] and d["tier"] in ("CORE", "ACTIVE"):
+            no_ci_active.append(d["full_name"])
+
+    no_arch = []
+    stale_active = []
+    for r in repos:
+        if r.get("is_archived", False):
+            continue
+        tier = r.get("classification", {}).get("tier")
+        if tier in ("CORE", "ACTIVE"):
+            if not r.get("architecture", {}).get("has_workflow", False):
+                no_arch.append(r["_full_name"])
+        elif tier in ("STALE", "DEAD", "DORMANT"):
+            stale_active.append(r["_full_name"])
+
     # 1. Repos with failing CI
-    failing_repos = [d for d in deployments if d["health"] == "FAILING"]
     if failing_repos:
         recs.append({
             "severity": "critical",
             "icon": "🔴",
             "title": f"{len(failing_repos)} repo(s) have failing CI pipelines",
             "description": "These repositories have 3+ recent workflow failures. Investigate and fix build/test issues.",
-            "repos": [d["full_name"] for d in failing_repos],
+            "repos": failing_repos,
             "action": "Inspect workflow logs and fix root causes immediately.",
         })
 
     # 2. Repos with degraded CI
-    degraded_repos = [d for d in deployments if d["health"] == "DEGRADED"]
     if degraded_repos:
         recs.append({
             "severity": "warning",
             "icon": "🟡",
             "title": f"{len(degraded_repos)} repo(s) have degraded CI health",
             "description": "Occasional failures detected. May indicate flaky tests or intermittent issues.",
-            "repos": [d["full_name"] for d in degraded_repos],
+            "repos": degraded_repos,
             "action": "Review recent failure logs to identify patterns (flaky tests, timeouts, dependency issues).",
         })
 
     # 3. Active repos with no CI
-    no_ci_active = [d for d in deployments if not d["has_ci"] and d["tier"] in ("CORE", "ACTIVE") and not d["is_archived"]]
     if no_ci_active:
         recs.append({
             "severity": "warning",
             "icon": "⚠️",
             "title": f"{len(no_ci_active)} active repo(s) have no CI/CD pipeline",
             "description": "Core/Active repos without continuous integration are at risk of undetected regressions.",
-            "repos": [d["full_name"] for d in no_ci_active],
+            "repos": no_ci_active,
             "action": "Deploy an architecture or security-scan workflow from the CHAD dashboard.",
         })
 
     # 4. Repos missing architecture workflow
-    no_arch = [r for r in repos if not r.get("architecture", {}).get("has_workflow", False)
-               and not r.get("is_archived", False)
-               and r.get("classification", {}).get("tier") in ("CORE", "ACTIVE")]
     if no_arch:
         recs.append({
             "severity": "info",
             "icon": "🏗️",
             "title": f"{len(no_arch)} repo(s) missing architecture diagrams workflow",
             "description": "Architecture diagrams keep documentation in sync. Deploy the workflow to auto-generate them.",
-            "repos": [f"{r.get('owner', 'unknown')}/{r['name']}" for r in no_arch],
+            "repos": no_arch,
             "action": "Use the Deploy Workflow feature on the main dashboard.",
         })
 
     # 5. Stale repos that should be archived
-    stale_active = [r for r in repos if r.get("classification", {}).get("tier") in ("STALE", "DEAD", "DORMANT")
-                    and not r.get("is_archived", False)]
     if stale_active:
         recs.append({
             "severity": "info",
             "icon": "📦",
             "title": f"{len(stale_active)} stale/dead repo(s) should be archived",
             "description": "These repos haven't had activity in a long time. Archiving reduces security surface area.",
-            "repos": [f"{r.get('owner', 'unknown')}/{r['name']}" for r in stale_active],
+            "repos": stale_active,
             "action": "Select these repos on the main dashboard and use Archive.",
         })
 
@@ -642,8 +1276,10 @@ def _build_recommendations(deployments, repos, report):
 # Workflow Deployment API  (CSIAC IAM + SoftSec)
 # ---------------------------------------------------------------------------
 
-# Valid GitHub repo name pattern
-_VALID_REPO_RE = re.compile(r"^[a-zA-Z0-9._-]{1,100}$")
+# Valid workflow template ID pattern — module-compiled so validation does
+# not round-trip through re's internal pattern cache on every request
+_VALID_WORKFLOW_ID_RE = re.compile(r"[a-zA-Z0-9_-]{1,50}", re.ASCII)
+_MAX_WORKFLOW_ID_LEN = 50
 
 # Deployable workflow templates — id → { file, target, label, description }
 _WORKFLOW_TEMPLATES_DIR = Path(__file__).parent / "workflow_templates"
@@ -690,31 +1326,60 @@ def _resolve_deploy_token():
     return None, None
 
 
+@functools.lru_cache(maxsize=4)
 def _github_headers(token):
-    return {
+    # The token rarely changes within a process, yet this dict used to be
+    # rebuilt for every GitHub call (2N+2 of them per deploy request).
+    # A read-only mapping proxy is safe to share across threads; requests
+    # accepts any mapping for headers=.
+    return types.MappingProxyType({
         "Authorization": f"token {token}",
         "Accept": "application/vnd.github+json",
         "X-GitHub-Api-Version": "2022-11-28",
-    }
+    })
+
+
+# Shared session for all GitHub API calls: keep-alive + a pooled adapter
+# mean every endpoint (architecture fetches, deploy fan-out) reuses TLS
+# connections to api.github.com instead of paying a ~100-300ms handshake
+# per call. Transient 5xx responses get a short retry with backoff.
+_github_session = http_requests.Session()
+_github_session.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=32,
+        max_retries=Retry(total=2, backoff_factor=0.3,
+                          status_forcelist=[502, 503, 504]),
+    ),
+)
+
+# Cap on concurrent GitHub calls during a deploy fan-out
+_DEPLOY_MAX_WORKERS = 10
 
 
-def _resolve_workflow_template(workflow_id: str):
-    """Resolve a workflow template file by ID. Returns (content, target_path, label) or raises."""
-    tmpl = _WORKFLOW_TEMPLATES.get(workflow_id)
-    if not tmpl:
-        return None, None, None
+def _build_template_cache() -> dict:
+    """Read and base64-encode each deployable template once at import.
 
-    # Check workflow_templates dir first, then legacy path
-    tmpl_path = _WORKFLOW_TEMPLATES_DIR / tmpl["file"]
-    if not tmpl_path.exists():
-        # Legacy: try .github/workflows/
-        tmpl_path = Path(__file__).parent / ".github" / "workflows" / tmpl["file"]
+    Templates never change during the process lifetime, so the
+    per-request exists() + read + b64encode work in the deploy path was
+    pure waste. Maps workflow_id -> (b64_content, target_path, label);
+    templates whose file is missing are omitted.
+    """
+    cache = {}
+    for wf_id, tmpl in _WORKFLOW_TEMPLATES.items():
+        # Check workflow_templates dir first, then legacy path
+        tmpl_path = _WORKFLOW_TEMPLATES_DIR / tmpl["file"]
+        if not tmpl_path.exists():
+            tmpl_path = Path(__file__).parent / ".github" / "workflows" / tmpl["file"]
+        if not tmpl_path.exists():
+            continue
+        b64 = base64.b64encode(tmpl_path.read_bytes()).decode("ascii")
+        cache[wf_id] = (b64, tmpl["target"], tmpl["label"])
+    return cache
 
-    if not tmpl_path.exists():
-        return None, None, None
 
-    content = tmpl_path.read_text(encoding="utf-8")
-    return content, tmpl["target"], tmpl["label"]
+_WORKFLOW_TEMPLATE_CACHE = _build_template_cache()
 
 
 @app.route("/api/workflows", methods=["GET"])
@@ -722,19 +1387,85 @@ def list_workflows():
     """List available workflow templates that can be deployed."""
     workflows = []
     for wf_id, tmpl in _WORKFLOW_TEMPLATES.items():
-        tmpl_path = _WORKFLOW_TEMPLATES_DIR / tmpl["file"]
-        if not tmpl_path.exists():
-            tmpl_path = Path(__file__).parent / ".github" / "workflows" / tmpl["file"]
         workflows.append({
             "id": wf_id,
             "label": tmpl["label"],
             "description": tmpl["description"],
             "target": tmpl["target"],
-            "available": tmpl_path.exists(),
+            "available": wf_id in _WORKFLOW_TEMPLATE_CACHE,
         })
     return jsonify({"workflows": workflows})
 
 
+def _deploy_one(owner, repo, workflow_id, target_path, workflow_b64, headers, rid):
+    """Deploy the workflow file to a single repo. Thread-safe worker for the
+    deploy fan-out — request context (request_id) is passed in explicitly
+    because flask.g is not available off the request thread.
+    """
+    entry = {"repo": repo, "status": "pending", "workflow": workflow_id}
+    try:
+        contents_url = f"https://api.github.com/repos/{owner}/{repo}/contents/{target_path}"
+        put_payload = {
+            "message": f"ci: deploy {workflow_id} workflow via CHAD dashboard [skip ci]",
+            "content": workflow_b64,
+            "committer": {
+                "name": "CHAD Dashboard",
+                "email": "chad-bot@bluefalconink.com",
+            },
+        }
+
+        # Optimistic create: PUT without sha succeeds outright when the file
+        # doesn't exist yet (the common greenfield case), saving the
+        # existence-check GET. GitHub answers 409/422 when the file is
+        # already there and a sha is required — only then pay for the GET
+        # and retry as an update.
+        sha = None
+        put_resp = _github_session.put(contents_url, headers=headers, json=put_payload, timeout=30)
+
+        if put_resp.status_code in (409, 422):
+            check_resp = _github_session.get(contents_url, headers=headers, timeout=15)
+            if check_resp.status_code == 200:
+                sha = _json_loads(check_resp.content).get("sha")
+            if sha:
+                put_payload["sha"] = sha
+                put_resp = _github_session.put(contents_url, headers=headers, json=put_payload, timeout=30)
+
+        if put_resp.status_code in (200, 201):
+            entry["status"] = "ok"
+            entry["action"] = "updated" if sha else "created"
+            log_security_event(
+                logger, "deploy_workflow_success",
+                "Workflow deployed to %s/%s", owner, repo,
+                request_id=rid,
+                repo=repo,
+                action=entry["action"],
+            )
+        else:
+            entry["status"] = "error"
+            err_body = _json_loads(put_resp.content) if put_resp.headers.get("content-type", "").startswith("application/json") else {}
+            entry["message"] = err_body.get("message", f"HTTP {put_resp.status_code}")
+            log_security_event(
+                logger, "deploy_workflow_failure",
+                "Failed to deploy to %s/%s: %s", owner, repo, entry["message"],
+                request_id=rid,
+                repo=repo,
+                http_status=put_resp.status_code,
+                level=logging.WARNING,
+            )
+    except http_requests.Timeout:
+        entry["status"] = "error"
+        entry["message"] = "Request timed out"
+    except Exception as exc:
+        entry["status"] = "error"
+        entry["message"] = str(exc)[:200]
+        logger.exception(
+            "Unexpected error deploying workflow to %s/%s", owner, repo,
+            extra={"request_id": rid},
+        )
+
+    return entry
+
+
 @app.route("/api/deploy-workflow", methods=["POST"])
 def deploy_workflow():
     """Deploy a workflow to one or more repos.
@@ -757,7 +1488,7 @@ def deploy_workflow():
         log_security_event(
             logger, "auth_failure",
             "No GitHub token available for deploy-workflow",
-            source_ip=get_client_ip(request),
+            source_ip=g.get("client_ip", "unknown"),
             request_id=g.get("request_id", ""),
         )
         return jsonify({"error": "Authentication required. Provide a Bearer token or configure GITHUB_TOKEN on the server."}), 401
@@ -766,15 +1497,15 @@ def deploy_workflow():
 
     # Validate owner
     owner = body.get("owner", os.environ.get("GITHUB_OWNER", "koreric75"))
-    if not _VALID_OWNER_RE.match(owner):
+    if not _is_valid_owner(owner):
         log_security_event(
             logger, "input_validation_failure",
-            f"Invalid owner for deploy-workflow: {str(owner)[:50]}",
-            source_ip=get_client_ip(request),
+            "Invalid owner for deploy-workflow: %.50s", str(owner),
+            source_ip=g.get("client_ip", "unknown"),
             request_id=g.get("request_id", ""),
-            level=__import__("logging").WARNING,
+            level=logging.WARNING,
         )
-        return jsonify({"error": "Invalid owner parameter"}), 400
+        return _error_response("bad_owner")
 
     # Validate repos list
     repos = body.get("repos", [])
@@ -784,98 +1515,50 @@ def deploy_workflow():
         return jsonify({"error": "Maximum 20 repos per request"}), 400
 
     for repo in repos:
-        if not isinstance(repo, str) or not _VALID_REPO_RE.match(repo):
+        if not _is_valid_repo(repo):
             return jsonify({"error": f"Invalid repo name: {str(repo)[:100]}"}), 400
 
     # Resolve workflow template by ID (default: architecture for backward compat)
     workflow_id = body.get("workflow", "architecture")
-    if not isinstance(workflow_id, str) or not re.match(r"^[a-zA-Z0-9_-]{1,50}$", workflow_id):
+    if (not isinstance(workflow_id, str)
+            or not (1 <= len(workflow_id) <= _MAX_WORKFLOW_ID_LEN)
+            or not _VALID_WORKFLOW_ID_RE.fullmatch(workflow_id)):
         return jsonify({"error": "Invalid workflow parameter"}), 400
 
-    workflow_content, target_path, workflow_label = _resolve_workflow_template(workflow_id)
-    if not workflow_content:
+    cached_template = _WORKFLOW_TEMPLATE_CACHE.get(workflow_id)
+    if not cached_template:
         logger.error("Workflow template not found for id=%s", workflow_id)
         return jsonify({"error": f"Workflow template '{workflow_id}' not found on server"}), 500
 
-    workflow_b64 = base64.b64encode(workflow_content.encode("utf-8")).decode("ascii")
+    workflow_b64, target_path, workflow_label = cached_template
 
     log_security_event(
         logger, "deploy_workflow_start",
-        f"Deploying {workflow_id} workflow to {len(repos)} repo(s) for owner={owner}",
-        source_ip=get_client_ip(request),
+        "Deploying %s workflow to %s repo(s) for owner=%s", workflow_id, len(repos), owner,
+        source_ip=g.get("client_ip", "unknown"),
         request_id=g.get("request_id", ""),
         token_source=token_source,
         repos=repos,
     )
 
     headers = _github_headers(token)
-    results = []
+    rid = g.get("request_id", "")
 
-    for repo in repos:
-        entry = {"repo": repo, "status": "pending", "workflow": workflow_id}
-        try:
-            # Check if file already exists (to get the sha for update)
-            check_url = f"https://api.github.com/repos/{owner}/{repo}/contents/{target_path}"
-            check_resp = http_requests.get(check_url, headers=headers, timeout=15)
+    # Each repo's GET+PUT pair is independent I/O — fan them out so the
+    # request completes in roughly one round-trip pair instead of N.
+    # executor.map preserves input ordering for the results list.
+    def _deploy(repo):
+        return _deploy_one(owner, repo, workflow_id, target_path,
+                           workflow_b64, headers, rid)
 
-            sha = None
-            if check_resp.status_code == 200:
-                sha = check_resp.json().get("sha")
-
-            # Create or update the file
-            put_payload = {
-                "message": f"ci: deploy {workflow_id} workflow via CHAD dashboard [skip ci]",
-                "content": workflow_b64,
-                "committer": {
-                    "name": "CHAD Dashboard",
-                    "email": "chad-bot@bluefalconink.com",
-                },
-            }
-            if sha:
-                put_payload["sha"] = sha
-
-            put_resp = http_requests.put(check_url, headers=headers, json=put_payload, timeout=30)
-
-            if put_resp.status_code in (200, 201):
-                entry["status"] = "ok"
-                entry["action"] = "updated" if sha else "created"
-                log_security_event(
-                    logger, "deploy_workflow_success",
-                    f"Workflow deployed to {owner}/{repo}",
-                    request_id=g.get("request_id", ""),
-                    repo=repo,
-                    action=entry["action"],
-                )
-            else:
-                entry["status"] = "error"
-                err_body = put_resp.json() if put_resp.headers.get("content-type", "").startswith("application/json") else {}
-                entry["message"] = err_body.get("message", f"HTTP {put_resp.status_code}")
-                log_security_event(
-                    logger, "deploy_workflow_failure",
-                    f"Failed to deploy to {owner}/{repo}: {entry['message']}",
-                    request_id=g.get("request_id", ""),
-                    repo=repo,
-                    http_status=put_resp.status_code,
-                    level=__import__("logging").WARNING,
-                )
-        except http_requests.Timeout:
-            entry["status"] = "error"
-            entry["message"] = "Request timed out"
-        except Exception as exc:
-            entry["status"] = "error"
-            entry["message"] = str(exc)[:200]
-            logger.exception(
-                "Unexpected error deploying workflow to %s/%s", owner, repo,
-                extra={"request_id": g.get("request_id", "")},
-            )
-
-        results.append(entry)
+    with ThreadPoolExecutor(max_workers=min(_DEPLOY_MAX_WORKERS, len(repos))) as executor:
+        results = list(executor.map(_deploy, repos))
 
     success_count = sum(1 for r in results if r["status"] == "ok")
     log_security_event(
         logger, "deploy_workflow_complete",
-        f"Deploy complete: {success_count}/{len(repos)} succeeded",
-        request_id=g.get("request_id", ""),
+        "Deploy complete: %s/%s succeeded", success_count, len(repos),
+        request_id=rid,
     )
 
     return jsonify({
@@ -899,101 +1582,50 @@ _last_refresh_time: float = 0.0
 _refresh_lock = threading.Lock()
 _refresh_in_progress: bool = False
 
+# Set on shutdown so the periodic loop wakes immediately instead of
+# wedging in a sleep for up to REFRESH_INTERVAL (Cloud Run sends SIGTERM
+# and expects the container to exit promptly)
+_stop_event = threading.Event()
+
 
 def _dashboard_has_data() -> bool:
     """Return True if the dashboard has real audit data (not a placeholder)."""
-    report_path = STATIC_DIR / "audit_report.json"
-    if not report_path.exists():
-        return False
-    try:
-        rpt = json.loads(report_path.read_text())
-        return rpt.get("summary", {}).get("total_repos", 0) > 0
-    except Exception:
+    rpt = _load_report_cached()
+    if rpt is None:
         return False
+    return rpt.get("summary", {}).get("total_repos", 0) > 0
 
 
 def _run_refresh_cycle():
     """Execute one audit + dashboard + ops page generation cycle.
 
-    Returns True on success, False on failure.
+    Returns True on success, False on failure. Delegates to _do_refresh,
+    which runs the pipeline stages in-process when the generator modules
+    are importable — the cycle is then one thread, not three fork+exec'd
+    interpreters — with the subprocess path kept as fallback. Stage
+    timeouts stay at the loop's more generous 180s/60s.
     """
-    global _last_refresh_time, _refresh_in_progress
     token = (os.environ.get("GITHUB_TOKEN") or os.environ.get("GH_TOKEN") or "").strip()
     if not token:
         logger.info("No GITHUB_TOKEN configured — skipping auto-refresh")
         return False
 
     owner = os.environ.get("GITHUB_OWNER", "koreric75")
-    _refresh_in_progress = True
-    logger.info(f"Auto-refresh: starting audit for owner={owner}")
+    logger.info("Auto-refresh: starting audit for owner=%s", owner)
 
     try:
-        env = os.environ.copy()
-        env["GITHUB_TOKEN"] = token
-        env["GH_TOKEN"] = token
-        app_dir = Path(__file__).parent
-
-        # Build auditor command with extra orgs support
-        cmd = [
-            sys.executable, "repo_auditor.py",
-            "--owner", owner,
-            "--output", str(STATIC_DIR / "audit_report.json"),
-        ]
-        if EXTRA_ORGS:
-            cmd.extend(["--extra-orgs", EXTRA_ORGS])
-
-        # Run auditor
-        logger.info(f"Auto-refresh: running auditor cmd={cmd}")
-        result = subprocess.run(
-            cmd,
-            capture_output=True, text=True, timeout=180, env=env,
-            cwd=app_dir,
-        )
-        if result.returncode != 0:
-            logger.error(f"Auto-refresh audit failed (rc={result.returncode}): "
-                         f"stderr={result.stderr[:500]} stdout={result.stdout[:300]}")
-            return False
-
-        # Generate dashboard
-        logger.info("Auto-refresh: generating dashboard HTML")
-        result2 = subprocess.run(
-            [sys.executable, "dashboard_generator.py",
-             "--input", str(STATIC_DIR / "audit_report.json"),
-             "--output", str(STATIC_DIR / "dashboard.html")],
-            capture_output=True, text=True, timeout=60,
-            cwd=app_dir,
+        result = _do_refresh(
+            owner, token, "auto-refresh", audit_timeout=180, gen_timeout=60,
         )
-        if result2.returncode != 0:
-            logger.error(f"Auto-refresh dashboard generation failed: {result2.stderr[:500]}")
-            return False
-
-        # Generate Ops Center page
-        mermaid_path = app_dir / "docs" / "architecture.mermaid"
-        logger.info("Auto-refresh: generating ops page")
-        result3 = subprocess.run(
-            [sys.executable, "ops_page_generator.py",
-             "--input", str(STATIC_DIR / "audit_report.json"),
-             "--mermaid", str(mermaid_path),
-             "--output", str(STATIC_DIR / "ops.html")],
-            capture_output=True, text=True, timeout=60,
-            cwd=app_dir,
-        )
-        if result3.returncode != 0:
-            logger.warning(f"Auto-refresh ops page generation failed (non-fatal): {result3.stderr[:300]}")
-
-        report = json.loads((STATIC_DIR / "audit_report.json").read_text())
-        total = report.get("summary", {}).get("total_repos", 0)
-        _last_refresh_time = time.time()
-        logger.info(f"Auto-refresh complete: {total} repos audited")
+        logger.info("Auto-refresh complete: %s repos audited", result["total_repos"])
         return True
-    except subprocess.TimeoutExpired:
+    except (subprocess.TimeoutExpired, FuturesTimeout):
         logger.error("Auto-refresh timed out")
         return False
     except Exception:
-        logger.exception("Auto-refresh failed with unexpected error")
+        # Stage failures are already logged inside _do_refresh
+        logger.error("Auto-refresh failed")
         return False
-    finally:
-        _refresh_in_progress = False
 
 
 def _auto_refresh_loop():
@@ -1023,21 +1655,25 @@ def _auto_refresh_loop():
     # Initial refresh — retry up to 3 times on failure (token may not be
     # available instantly on Cloud Run cold-start).
     for attempt in range(1, 4):
-        with _refresh_lock:
-            ok = _run_refresh_cycle()
+        ok = _run_refresh_cycle()
         if ok:
             break
         wait = 15 * attempt
-        logger.warning(f"Auto-refresh attempt {attempt}/3 failed, retrying in {wait}s")
-        time.sleep(wait)
+        logger.warning("Auto-refresh attempt %s/3 failed, retrying in %ss", attempt, wait)
+        if _stop_event.wait(wait):
+            return
 
-    # Periodic loop
-    logger.info(f"Scheduled periodic refresh every {REFRESH_INTERVAL}s ({REFRESH_INTERVAL / 3600:.1f}h)")
-    while True:
-        time.sleep(REFRESH_INTERVAL)
+    # Periodic loop — Event.wait doubles as an interruptible sleep: it
+    # returns True (and ends the loop) as soon as _stop_event is set
+    logger.info("Scheduled periodic refresh every %ss (%.1fh)", REFRESH_INTERVAL, REFRESH_INTERVAL / 3600)
+    while not _stop_event.wait(REFRESH_INTERVAL):
         logger.info("Periodic auto-refresh triggered")
-        with _refresh_lock:
-            _run_refresh_cycle()
+        _run_refresh_cycle()
+
+
+def _stop_auto_refresh(*_args):
+    """Wake the refresh loop so it exits; safe to call more than once."""
+    _stop_event.set()
 
 
 def _start_auto_refresh():
@@ -1045,6 +1681,16 @@ def _start_auto_refresh():
     t = threading.Thread(target=_auto_refresh_loop, daemon=True, name="auto-refresh")
     t.start()
 
+    atexit.register(_stop_auto_refresh)
+    # Cloud Run delivers SIGTERM before killing the container; only the
+    # main thread may set signal handlers, and gunicorn installs its own
+    # (the atexit hook covers that case)
+    if threading.current_thread() is threading.main_thread():
+        try:
+            signal.signal(signal.SIGTERM, _stop_auto_refresh)
+        except ValueError:
+            pass
+
 
 # Trigger auto-refresh loop when the module is first loaded by gunicorn
 _start_auto_refresh()
@@ -1054,5 +1700,5 @@ if __name__ == "__main__":
     # CSIAC SoftSec: Never default to debug=True in production
     debug_mode = os.environ.get("FLASK_DEBUG", "false").lower() == "true"
     port = int(os.environ.get("PORT", 8080))
-    logger.info(f"Starting CHAD Dashboard on port {port} (debug={debug_mode})")
+    logger.info("Starting CHAD Dashboard on port %s (debug=%s)", port, debug_mode)
     app.run(host="0.0.0.0", port=port, debug=debug_mode)
@@ -0,0 +1,19 @@
+"""Gunicorn configuration for the CHAD Dashboard (Cloud Run).
+
+gthread workers let the I/O-bound endpoints (GitHub HTTPS calls, static
+file serving, refresh polling) overlap while the GIL is released, instead
+of serializing every request on a sync worker.
+"""
+
+import os
+
+bind = f"0.0.0.0:{os.environ.get('PORT', '8080')}"
+workers = 2
+threads = 8
+worker_class = "gthread"
+# Must exceed the longest refresh stage timeout so /api/refresh isn't
+# killed mid-audit
+timeout = 150
+# Heartbeat files in /dev/shm avoid periodic writes to the (slow)
+# container overlay filesystem
+worker_tmp_dir = "/dev/shm"